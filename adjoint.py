@@ -0,0 +1,83 @@
+# adjoint.py
+import numpy as np
+from circuit import QuantumCircuit, apply_single_qubit, apply_controlled_x
+from gates import H, X, Y, Z, RX, RY, RZ
+
+FIXED_GATES = {"H": H, "X": X, "Y": Y, "Z": Z}
+ROTATION_GATES = {"RX": (RX, X), "RY": (RY, Y), "RZ": (RZ, Z)}
+
+
+def _gate_matrix(gate):
+    """Return the 2x2 matrix for a single-qubit entry of a gate sequence."""
+    gtype = gate["gate"]
+    if gtype in FIXED_GATES:
+        return FIXED_GATES[gtype]
+    if gtype in ROTATION_GATES:
+        return ROTATION_GATES[gtype][0](gate["theta"])
+    raise ValueError(f"Unsupported gate '{gtype}'.")
+
+
+def _apply(qc, gate):
+    """Apply one gate-sequence entry to qc."""
+    if gate["gate"] == "CX":
+        qc.apply_cx(gate["control"], gate["target"])
+    else:
+        qc.apply_gate(_gate_matrix(gate), gate["target"])
+
+
+def _apply_inverse(state, gate, num_qubits):
+    """Return state with the inverse of one gate-sequence entry applied."""
+    if gate["gate"] == "CX":
+        # CX is its own inverse
+        return apply_controlled_x(state, gate["control"], gate["target"], num_qubits)
+    matrix = _gate_matrix(gate)
+    return apply_single_qubit(state, matrix.conj().T, gate["target"], num_qubits)
+
+
+def _matrix_element(bra, op, ket, qubit, num_qubits):
+    """<bra|op|ket> for a 2x2 op on one qubit, without a third statevector."""
+    shape = (2**qubit, 2, 2**(num_qubits - qubit - 1))
+    bra, ket = bra.reshape(shape), ket.reshape(shape)
+    return sum(op[i, j] * np.vdot(bra[:, i, :], ket[:, j, :])
+               for i in range(2) for j in range(2) if op[i, j] != 0)
+
+
+def run_sequence(num_qubits, gate_sequence):
+    """Simulate a gate sequence from |00…0> and return the circuit."""
+    qc = QuantumCircuit(num_qubits)
+    for gate in gate_sequence:
+        _apply(qc, gate)
+    return qc
+
+
+def adjoint_gradient(num_qubits, gate_sequence, observable, qubit):
+    """Expectation value <ψ|O|ψ> and its gradient w.r.t. every rotation angle.
+
+    gate_sequence uses the same dicts as draw_circuit, with rotation gates
+    written as {"gate": "RX", "target": q, "theta": θ}. observable is a
+    2x2 Hermitian matrix measured on `qubit`. All gradients come from one
+    forward and one backward pass over the sequence instead of two extra
+    simulations per parameter. The backward pass holds two statevectors,
+    each gate costs O(2^n), and the per-step cost does not grow with the
+    number of parameters.
+
+    Returns (expectation, gradients) where gradients follows the order of
+    the rotation gates in gate_sequence.
+    """
+    # Forward pass: |φ> = U_N … U_1 |0>, |λ> = O |φ>
+    phi = run_sequence(num_qubits, gate_sequence).state
+    lam = apply_single_qubit(phi, observable, qubit, num_qubits)
+    expectation = np.vdot(phi, lam).real
+
+    # Backward pass: peel gates off both states. For a rotation,
+    # dU_k/dθ = -i/2 P U_k, so each derivative is 2 Re <λ_k| -i/2 P |φ_k>.
+    gradients = []
+    for gate in reversed(gate_sequence):
+        if gate["gate"] in ROTATION_GATES:
+            generator = ROTATION_GATES[gate["gate"]][1]
+            element = _matrix_element(lam, generator, phi, gate["target"], num_qubits)
+            gradients.append(2 * (-0.5j * element).real)
+        phi = _apply_inverse(phi, gate, num_qubits)
+        lam = _apply_inverse(lam, gate, num_qubits)
+
+    return expectation, np.array(gradients[::-1])
@@ -1,25 +1,59 @@
 # circuit.py
+import os
+import struct
+import tempfile
 import numpy as np
 
+# Checkpoint layout: fixed little-endian header, the MT19937 key used by
+# np.random, then the raw amplitude buffer starting at a 64-byte boundary.
+CHECKPOINT_MAGIC = b"IQSC"
+CHECKPOINT_VERSION = 1
+CHECKPOINT_HEADER = struct.Struct("<4sHHIQiid")
+CHECKPOINT_ALIGN = 64
+MT19937_KEY_WORDS = 624
+MAX_CHECKPOINT_QUBITS = 63
+FLAG_FLOAT32 = 0x1
+
+def apply_single_qubit(state, gate_matrix, qubit_index, num_qubits):
+    """Return a new state with a 2x2 matrix applied to one qubit.
+
+    Qubit 0 is the most significant bit, as in a kron(q0, q1, …) operator,
+    but only the statevector is touched: O(2^n) time and memory.
+    """
+    # Split the index into (higher qubits, this qubit, lower qubits)
+    psi = np.asarray(state).reshape(2**qubit_index, 2, 2**(num_qubits - qubit_index - 1))
+    return np.matmul(gate_matrix, psi).reshape(state.shape)
+
+def apply_controlled_x(state, control, target, num_qubits):
+    """Return a new state with CNOT applied; qubit k is bit (index >> k) & 1."""
+    psi = np.array(state).reshape((2,) * num_qubits)
+    ctrl_axis, tgt_axis = num_qubits - 1 - control, num_qubits - 1 - target
+    on0 = [slice(None)] * num_qubits
+    on0[ctrl_axis], on0[tgt_axis] = 1, 0
+    on1 = list(on0)
+    on1[tgt_axis] = 1
+    on0, on1 = tuple(on0), tuple(on1)
+    # Swap the target amplitudes wherever the control bit is set
+    psi[on0], psi[on1] = psi[on1].copy(), psi[on0].copy()
+    return psi.reshape(state.shape)
+
 class QuantumCircuit:
-    def __init__(self, num_qubits):
+    def __init__(self, num_qubits, state=None, gate_count=0):
         self.num_qubits = num_qubits
-        # Initialize state |00…0>
-        self.state = np.zeros((2**num_qubits, 1), dtype=complex)
-        self.state[0, 0] = 1
+        if state is None:
+            # Initialize state |00…0>
+            state = np.zeros((2**num_qubits, 1), dtype=complex)
+            state[0, 0] = 1
+        self.state = state
+        # Number of gates applied so far, restored when resuming a checkpoint
+        self.gate_count = gate_count
 
     def apply_gate(self, gate_matrix, qubit_index):
         """Apply a single-qubit gate to qubit_index in an N-qubit system."""
         if not (0 <= qubit_index < self.num_qubits):
             raise IndexError(f"Qubit index {qubit_index} out of range.")
-        # build full operator by tensoring I or gate
-        ops = []
-        for i in range(self.num_qubits):
-            ops.append(gate_matrix if i == qubit_index else np.eye(2, dtype=complex))
-        full_op = ops[0]
-        for op in ops[1:]:
-            full_op = np.kron(full_op, op)
-        self.state = full_op.dot(self.state)
+        self.state = apply_single_qubit(self.state, gate_matrix, qubit_index, self.num_qubits)
+        self.gate_count += 1
 
     def apply_cx(self, control, target):
         """Apply CNOT for any two distinct qubits in an N-qubit system."""
@@ -27,21 +61,84 @@ class QuantumCircuit:
             raise ValueError("Control and target must be different qubits.")
         if not (0 <= control < self.num_qubits) or not (0 <= target < self.num_qubits):
             raise IndexError("Control/target qubit index out of range.")
+        self.state = apply_controlled_x(self.state, control, target, self.num_qubits)
+        self.gate_count += 1
+
+    def save_checkpoint(self, path, single_precision=False):
+        """Write the state, gate count and np.random state to a binary file.
+
+        With single_precision the amplitudes are stored as float32 pairs
+        (complex64), halving the file size at the cost of precision. The
+        file is written to a temporary sibling and swapped into place, so
+        a crash mid-save leaves the previous checkpoint intact. On POSIX a
+        circuit loaded from path can be saved back to it; Windows refuses
+        to replace a file that is still memory-mapped, so save elsewhere
+        or apply a gate first there.
+        """
+        dtype = np.complex64 if single_precision else np.complex128
+        flags = FLAG_FLOAT32 if single_precision else 0
+        _, key, pos, has_gauss, cached_gaussian = np.random.get_state()
+        header = CHECKPOINT_HEADER.pack(CHECKPOINT_MAGIC, CHECKPOINT_VERSION, flags,
+                                        self.num_qubits, self.gate_count,
+                                        pos, has_gauss, cached_gaussian)
+        key = np.asarray(key, dtype="<u4")
+        used = len(header) + key.nbytes
+        padding = b"\0" * (-used % CHECKPOINT_ALIGN)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)),
+                                        prefix=".checkpoint-")
+        try:
+            f = os.fdopen(fd, "wb")
+        except BaseException:
+            os.close(fd)
+            os.unlink(tmp_path)
+            raise
+        try:
+            with f:
+                f.write(header)
+                f.write(key.tobytes())
+                f.write(padding)
+                np.ascontiguousarray(self.state, dtype=dtype).tofile(f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @classmethod
+    def load_checkpoint(cls, path, restore_rng=True):
+        """Resume a circuit saved with save_checkpoint.
+
+        The amplitude buffer is memory-mapped read-only rather than copied;
+        gates replace self.state, so the file itself is never modified.
+        """
+        with open(path, "rb") as f:
+            raw = f.read(CHECKPOINT_HEADER.size)
+            if len(raw) < CHECKPOINT_HEADER.size:
+                raise ValueError(f"{path} is too short to be a checkpoint.")
+            magic, version, flags, num_qubits, gate_count, pos, has_gauss, cached_gaussian = \
+                CHECKPOINT_HEADER.unpack(raw)
+            if magic != CHECKPOINT_MAGIC:
+                raise ValueError(f"{path} is not an IndiQSim checkpoint.")
+            if version != CHECKPOINT_VERSION:
+                raise ValueError(f"Unsupported checkpoint version {version}.")
+            key = np.frombuffer(f.read(MT19937_KEY_WORDS * 4), dtype="<u4")
+            if len(key) != MT19937_KEY_WORDS:
+                raise ValueError(f"{path} is truncated inside the RNG state.")
 
-        # Build CNOT by summing projectors
-        size = 2**self.num_qubits
-        new_state = np.zeros_like(self.state)
-        for basis_index in range(size):
-            bits = [(basis_index >> i) & 1 for i in reversed(range(self.num_qubits))]
-            if bits[self.num_qubits - 1 - control] == 0:
-                # control=0 → unchanged
-                new_state[basis_index, 0] += self.state[basis_index, 0]
-            else:
-                # control=1 → flip target bit
-                bits_flipped = bits.copy()
-                tgt_pos = self.num_qubits - 1 - target
-                bits_flipped[tgt_pos] ^= 1
-                new_index = sum(bit << (self.num_qubits - 1 - i)
-                                for i, bit in enumerate(bits_flipped))
-                new_state[new_index, 0] += self.state[basis_index, 0]
-        self.state = new_state
+        used = CHECKPOINT_HEADER.size + key.nbytes
+        offset = used + (-used % CHECKPOINT_ALIGN)
+        if flags & ~FLAG_FLOAT32:
+            raise ValueError(f"{path} uses unknown checkpoint flags {flags:#x}.")
+        if num_qubits > MAX_CHECKPOINT_QUBITS:
+            raise ValueError(f"{path} claims an unsupported {num_qubits}-qubit state.")
+        dtype = np.complex64 if flags & FLAG_FLOAT32 else np.complex128
+        data_size = os.path.getsize(path) - offset
+        if data_size != (1 << num_qubits) * np.dtype(dtype).itemsize:
+            raise ValueError(f"{path} has the wrong size for a {num_qubits}-qubit checkpoint.")
+        state = np.memmap(path, dtype=dtype, mode="r", offset=offset,
+                          shape=(2**num_qubits, 1))
+        qc = cls(num_qubits, state=state, gate_count=gate_count)
+        if restore_rng:
+            np.random.set_state(("MT19937", key.astype(np.uint32), pos, has_gauss, cached_gaussian))
+        return qc